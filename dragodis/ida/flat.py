@@ -1,11 +1,13 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+import bisect
+import itertools
+from functools import cached_property, lru_cache
 
 from .. import utils
 
-from typing import Iterable, Union, Optional
+from typing import Callable, Iterable, Union, Optional, List, Tuple
 
 from dragodis.interface.flat import FlatAPI, MISSING
 from dragodis.exceptions import NotExistError
@@ -24,19 +26,72 @@ from .variable import IDAGlobalVariable
 from ..interface import ReferenceType
 
 
-cache = lru_cache(maxsize=1024)
+_CACHE_SIZE = 4096
+
+
+def _cache_value(cache_dict: dict, key, value):
+    """
+    Stores given value within a per-instance cache dictionary.
+    If the cache is full, the oldest half of the entries are evicted.
+    """
+    if len(cache_dict) >= _CACHE_SIZE:
+        for old_key in list(itertools.islice(cache_dict, _CACHE_SIZE // 2)):
+            del cache_dict[old_key]
+    cache_dict[key] = value
+
+
+@lru_cache(maxsize=256)
+def _parse_type_name(name: str) -> Tuple[str, bool]:
+    """
+    Parses given data type name into the name IDA expects and whether it is a pointer.
+    """
+    is_ptr = name.endswith("*")
+    # Name has to be uppercase for get_named_type() to work.
+    return name.strip(" *").upper(), is_ptr
 
 
 class IDAFlatAPI(FlatAPI, IDADisassembler):
 
+    def __init__(self, *args, **kwargs):
+        # Caches used for converting between file offsets and addresses.
+        self._virtual_address_cache = {}
+        self._file_offset_cache = {}
+        # Cache of function signatures keyed by address.
+        self._function_signature_cache = {}
+        # Cache of resolved tinfo_t objects keyed by parsed data type name.
+        self._data_type_cache = {}
+        super().__init__(*args, **kwargs)
+
+    def start(self):
+        super().start()
+        # The loaded page index used by the helpers is module state within the IDA interpreter,
+        # which outlives a previously opened database when running natively.
+        self._ida_helpers.reset_loaded_pages()
+
+    def stop(self, *exc_info):
+        super().stop(*exc_info)
+        # Bound SDK functions and objects are no longer valid once the disassembler is stopped.
+        self.__dict__.pop("_get_loaded_value", None)
+        self._clear_segment_caches()
+        self._data_type_cache.clear()
+        self._function_signature_cache.clear()
+        # Offsets are plain integers, but are cleared as well so nothing
+        # from a previous session is carried over.
+        self._virtual_address_cache.clear()
+        self._file_offset_cache.clear()
+
+    # Bound once to avoid resolving the attribute chain on each call.
+    # (When running remotely, each attribute access of a module requires a separate request.)
+    @cached_property
+    def _get_loaded_value(self) -> Callable[[int, int], Optional[int]]:
+        return self._ida_helpers.get_loaded_value
+
     @property
     def _cached_memory(self):
         return CachedMemory(self)
 
-    def _bytes_loaded(self, addr: int, num_bytes: int) -> bool:
-        return self._ida_helpers.is_loaded(addr, num_bytes)
-
-    @property
+    # NOTE: Processor information doesn't change after loading, so it is only pulled once.
+    @cached_property
     def processor_name(self) -> str:
         proc = self._ida_ida.inf_get_procname()
         # Switching "metapc" to "x86" to match Ghidra.
@@ -49,7 +104,7 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
         cc_id = self._ida_ida.inf_get_cc_id()
         return self._ida_typeinf.get_compiler_name(cc_id)
 
-    @property
+    @cached_property
     def bit_size(self) -> int:
         # IDA 7.6 adds ida_ida.inf_get_app_bitness()
         if self._idaapi.IDA_SDK_VERSION >= 760:
@@ -62,7 +117,7 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
         else:
             return 16
 
-    @property
+    @cached_property
     def is_big_endian(self) -> bool:
         return self._ida_ida.inf_is_be()
 
@@ -72,51 +127,66 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
         if address != self._BADADDR:
             return address
 
-    @cache
     def get_virtual_address(self, file_offset: int, default=MISSING) -> int:
+        try:
+            return self._virtual_address_cache[file_offset]
+        except KeyError:
+            pass
         addr = self._ida_loader.get_fileregion_ea(file_offset)
         if addr == self._idc.BADADDR:
             if default is MISSING:
                 raise NotExistError(f"Cannot get linear address for file offset: {hex(file_offset)}")
             return default
+        _cache_value(self._virtual_address_cache, file_offset, addr)
         return addr
 
-    @cache
     def get_file_offset(self, addr: int, default=MISSING) -> int:
+        try:
+            return self._file_offset_cache[addr]
+        except KeyError:
+            pass
         file_offset = self._ida_loader.get_fileregion_offset(addr)
         if file_offset == -1:
             if default is MISSING:
                 raise NotExistError(f"Cannot get file offset for address: {hex(addr)}")
             return default
+        _cache_value(self._file_offset_cache, addr, file_offset)
         return file_offset
 
     def functions(self, start=None, end=None) -> Iterable[IDAFunction]:
-        # TODO: use remove_eval to optimize this?
-        #   - Create mechanism to chunk iterators?
-        #   - Reimplement idautils.Functions here?
-        for ea in self._idautils.Functions(start=start, end=end):
-            # IDA will include the function if started in the middle of it.
-            # Ignore this function to stay consistent with Ghidra.
-            if start and ea < start:
-                continue
-            yield self.get_function(ea)
+        # Pull all the addresses in a single call and bind get_func() once for the loop.
+        # (Functions starting before the start address are already excluded to stay consistent with Ghidra.)
+        get_func = self._ida_funcs.get_func
+        for ea in self._ida_helpers.get_function_addresses(start, end):
+            func_t = get_func(ea)
+            if func_t:
+                yield IDAFunction(self, func_t)
+
+    def function_addresses(self, start=None, end=None) -> List[int]:
+        return list(self._ida_helpers.get_function_addresses(start, end))
 
     # TODO: make a Memory object?
 
     def get_byte(self, addr: int, default=MISSING) -> int:
-        if not self._bytes_loaded(addr, 1):
+        # Validate and pull value within a single call.
+        value = self._get_loaded_value(addr, 1)
+        if value is None:
             if default is MISSING:
                 raise NotExistError(f"Cannot get byte at {hex(addr)}")
             return default
-        return self._ida_bytes.get_wide_byte(addr)
+        return value
 
     def get_bytes(self, addr: int, length: int, default: int = None) -> bytes:
-        if default is None and not self._ida_helpers.is_loaded(addr, length):
-            raise NotExistError(
-                f"Unable to obtain {length} bytes from 0x{addr:08X}: "
-                f"Address range not fully loaded."
-            )
-        return self._ida_helpers.get_bytes(addr, length, default=default or 0)
+        if default is None:
+            # Validate and pull bytes within a single call.
+            data = self._ida_helpers.get_loaded_bytes(addr, length)
+            if data is None:
+                raise NotExistError(
+                    f"Unable to obtain {length} bytes from 0x{addr:08X}: "
+                    f"Address range not fully loaded."
+                )
+            return data
+        return self._ida_helpers.get_bytes(addr, length, default=default)
         # FIXME: Disabling use of cached memory since we aren't invalidating caches properly.
         # # If all bytes aren't available but a default was provided, get bytes
         # # one at a time, replacing invalid bytes with the default.
@@ -147,19 +217,22 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
             return found
 
     def get_word(self, addr: int) -> int:
-        if not self._bytes_loaded(addr, 2):
+        value = self._get_loaded_value(addr, 2)
+        if value is None:
             raise NotExistError(f"Cannot get word at {hex(addr)}")
-        return self._ida_bytes.get_wide_word(addr)
+        return value
 
     def get_dword(self, addr: int) -> int:
-        if not self._bytes_loaded(addr, 4):
+        value = self._get_loaded_value(addr, 4)
+        if value is None:
             raise NotExistError(f"Cannot get dword at {hex(addr)}")
-        return self._ida_bytes.get_wide_dword(addr)
+        return value
 
     def get_qword(self, addr: int) -> int:
-        if not self._bytes_loaded(addr, 8):
+        value = self._get_loaded_value(addr, 8)
+        if value is None:
             raise NotExistError(f"Cannot get qword at {hex(addr)}")
-        return self._ida_bytes.get_qword(addr)
+        return value
 
     def get_function(self, addr: int, default=MISSING) -> IDAFunction:
         func_t = self._ida_funcs.get_func(addr)
@@ -197,15 +270,32 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
         return IDAFunction(self, func)
 
     # TODO: Add support for providing an operand to help get a better function signature type.
-    @cache
     def get_function_signature(self, addr: int, default=MISSING) -> IDAFunctionSignature:
-        # Constructor will raise a NotExistError if we can't make a function signature.
+        cache_dict = self._function_signature_cache
         try:
-            return IDAFunctionSignature(self, addr)
-        except NotExistError:
-            if default is MISSING:
-                raise
-            return default
+            return cache_dict[addr]
+        except KeyError:
+            pass
+
+        # Normalize to the start of the function (if within one) so all addresses within
+        # the same function share a signature.
+        func_t = self._ida_funcs.get_func(addr)
+        start_address = func_t.start_ea if func_t else addr
+        try:
+            signature = cache_dict[start_address]
+        except KeyError:
+            # Constructor will raise a NotExistError if we can't make a function signature.
+            try:
+                signature = IDAFunctionSignature(self, start_address)
+            except NotExistError:
+                if default is MISSING:
+                    raise
+                return default
+            _cache_value(cache_dict, start_address, signature)
+
+        if addr != start_address:
+            _cache_value(cache_dict, addr, signature)
+        return signature
 
     def get_line(self, addr: int, default=MISSING) -> IDALine:
         try:
@@ -224,7 +314,21 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
             return default
         return IDARegister(self, reg_info.reg, reg_info.size)
 
-    @cache
+    @cached_property
+    def _segment_index(self) -> Tuple[List[int], List[int], List[IDASegment]]:
+        """
+        Sorted start addresses, end addresses and segment objects used to look up segments
+        by address without calling into IDA.
+        """
+        starts = []
+        ends = []
+        segments = []
+        for segment in self.segments:
+            starts.append(segment.start)
+            ends.append(segment.end)
+            segments.append(segment)
+        return starts, ends, segments
+
     def get_segment(self, addr_or_name: Union[int, str], default=MISSING) -> IDASegment:
         if isinstance(addr_or_name, str):
             name = addr_or_name
@@ -235,11 +339,13 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
                 return default
         elif isinstance(addr_or_name, int):
             addr = addr_or_name
-            segment_t = self._ida_segment.getseg(addr)
-            if not segment_t:
-                if default is MISSING:
-                    raise NotExistError(f"Could not find segment containing address: 0x{addr:08x}")
-                return default
+            starts, ends, segments = self._segment_index
+            index = bisect.bisect_right(starts, addr) - 1
+            if index >= 0 and addr < ends[index]:
+                return segments[index]
+            if default is MISSING:
+                raise NotExistError(f"Could not find segment containing address: 0x{addr:08x}")
+            return default
         else:
             raise ValueError(f"Invalid input: {addr_or_name!r}")
 
@@ -250,6 +356,7 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
         success = self._ida_segment.add_segm(0, start, start + size, name, "XTRN")
         if not success:
             raise ValueError(f"Unable to create segment at 0x{start:08x}")
+        self.invalidate_segments()
         return self.get_segment(start)
 
     @property
@@ -260,23 +367,53 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
             if seg:
                 yield IDASegment(self, seg)
 
+    def segment_bounds(self) -> List[Tuple[int, int]]:
+        return list(self._ida_helpers.get_segment_bounds())
+
+    def _clear_segment_caches(self):
+        """
+        Clears locally cached information derived from the segments.
+        (Doesn't require IDA to be running.)
+        """
+        # Segment index and address bounds will be rebuilt on next access.
+        self.__dict__.pop("_segment_index", None)
+        self.__dict__.pop("min_address", None)
+        self.__dict__.pop("max_address", None)
+
+    def invalidate_segments(self):
+        self._clear_segment_caches()
+        self._ida_helpers.reset_loaded_pages()
+
+    @cached_property
+    def _string_types(self) -> dict:
+        """
+        Mapping of bit width to IDA string type.
+        """
+        return {
+            8: self._ida_nalt.STRTYPE_C,
+            16: self._ida_nalt.STRTYPE_C_16,
+            32: self._ida_nalt.STRTYPE_C_32,
+        }
+
+    @cached_property
+    def _max_strlit_options(self) -> int:
+        """
+        Options used with get_max_strlit_length() to determine string length.
+        """
+        ida_bytes = self._ida_bytes
+        return ida_bytes.ALOPT_IGNCLT | ida_bytes.ALOPT_IGNPRINT | ida_bytes.ALOPT_MAX4K
+
     def get_string_bytes(self, addr: int, length: int = None, bit_width: int = None, default=MISSING) -> bytes:
         if bit_width is None:
             str_type = self._idc.get_str_type(addr)
-        elif bit_width == 8:
-            str_type = self._ida_nalt.STRTYPE_C
-        elif bit_width == 16:
-            str_type = self._ida_nalt.STRTYPE_C_16
-        elif bit_width == 32:
-            str_type = self._ida_nalt.STRTYPE_C_32
         else:
-            raise ValueError(f"Invalid bit width: {bit_width}")
+            try:
+                str_type = self._string_types[bit_width]
+            except KeyError:
+                raise ValueError(f"Invalid bit width: {bit_width}")
 
         if length is None:
-            length = self._ida_bytes.get_max_strlit_length(
-                addr, str_type,
-                self._ida_bytes.ALOPT_IGNCLT | self._ida_bytes.ALOPT_IGNPRINT | self._ida_bytes.ALOPT_MAX4K
-            )
+            length = self._ida_bytes.get_max_strlit_length(addr, str_type, self._max_strlit_options)
         ret = self._ida_bytes.get_strlit_contents(addr, length, str_type)
         if ret is None:
             if default is MISSING:
@@ -304,11 +441,12 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
             yield IDAString(self, string)
 
     def get_data_type(self, name: str, default=MISSING) -> IDADataType:
-        is_ptr = name.endswith("*")
-        name = name.strip(" *")
-
-        # Name has to be uppercase for get_named_type() to work.
-        name = name.upper()
+        key = _parse_type_name(name)
+        try:
+            return IDADataType(self, self._data_type_cache[key])
+        except KeyError:
+            pass
+        name, is_ptr = key
 
         # Create new tinfo object of type.
         tif = self._ida_typeinf.tinfo_t()
@@ -324,13 +462,15 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
             tif2.create_ptr(tif)
             tif = tif2
 
+        _cache_value(self._data_type_cache, key, tif)
         return IDADataType(self, tif)
 
-    @property
+    # NOTE: Address bounds are cached, but must be cleared if segments are created.
+    @cached_property
     def max_address(self) -> int:
         return self._ida_ida.inf_get_max_ea()
 
-    @property
+    @cached_property
     def min_address(self) -> int:
         return self._ida_ida.inf_get_min_ea()
 
@@ -342,19 +482,22 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
         return IDAMemory(self, start, end)
 
     def references_from(self, addr: int) -> Iterable[IDAReference]:
-        # TODO: Cache chunks
-        for xref in self._idautils.XrefsFrom(addr):
-            reference = IDAReference(self, xref)
-            # Ignore "ordinary flow" references, since that's just a reference to the next
-            # instruction, which Ghidra doesn't do.
-            if reference.type == ReferenceType.ordinary_flow:
-                continue
-            yield reference
+        # NOTE: "Ordinary flow" references are already filtered out by the helper, since that's
+        # just a reference to the next instruction, which Ghidra doesn't do.
+        for from_address, to_address, type_code, is_code in self._ida_helpers.get_xrefs_from(addr):
+            yield IDAReference(self, from_address, to_address, type_code, is_code)
+
+    def references_from_bulk(self, addr: int) -> List[Tuple[int, int, ReferenceType]]:
+        # Avoids creating IDAReference objects entirely.
+        type_table = IDAReference._type_table
+        return [
+            (from_address, to_address, type_table[type_code])
+            for from_address, to_address, type_code, _ in self._ida_helpers.get_xrefs_from(addr)
+        ]
 
     def references_to(self, addr: int) -> Iterable[IDAReference]:
-        # TODO: Cache chunks
-        for xref in self._idautils.XrefsTo(addr):
-            yield IDAReference(self, xref)
+        for from_address, to_address, type_code, is_code in self._ida_helpers.get_xrefs_to(addr):
+            yield IDAReference(self, from_address, to_address, type_code, is_code)
 
     def create_reference(self, from_address: int, to_address: int, ref_type: ReferenceType) -> IDAReference:
         ref_type = IDAReference._type_map_inv[ref_type]
@@ -369,16 +512,7 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
         if not success:
             raise ValueError(f"Unable to create reference: 0x{from_address:08x} -> 0x{to_address:08x}")
 
-        # IDA's xrefblt_t is actually an iterator which holds the attributes of the "current" reference
-        # being iterated.
-        # Copying the work done in xrefblt_t.refs_from()/refs_to()
-        xref = self._ida_xref.xrefblk_t()
-        xref.frm = from_address
-        xref.to = to_address
-        xref.type = ref_type
-        xref.iscode = code
-        xref.user = ref_type == 20
-        reference = IDAReference(self, xref)
+        reference = IDAReference(self, from_address, to_address, ref_type, code)
 
         # If reference is a new code call, tell analyzer to apply the callee's type to calling point.
         if reference.type == ReferenceType.code_call:
@@ -387,23 +521,22 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
         return reference
 
     def get_variable(self, addr: int, default=MISSING) -> IDAGlobalVariable:
-        start_address = self._ida_bytes.get_item_head(addr)
-        # Don't count code as "variables". Otherwise we get all the
-        # loop labels as variables.
-        flags = self._ida_bytes.get_flags(addr)
-        is_code = self._ida_bytes.is_code(flags)
-        # Only count as variable if item has a name.
-        if not is_code and self._ida_name.get_name(start_address):
+        start_address = self._ida_helpers.get_variable_address(addr)
+        if start_address is not None:
             return IDAGlobalVariable(self, start_address)
         elif default is MISSING:
             raise NotExistError(f"Variable doesn't exist at {hex(addr)}")
         else:
             return default
 
-    @property
-    def imports(self) -> Iterable[IDAImport]:
-        for address, thunk_address, name, namespace in self._ida_helpers.iter_imports():
-            yield IDAImport(self, address, thunk_address, name, namespace)
+    # NOTE: Imports and exports don't change after loading, so they are only pulled once.
+    #   Use "del dis.imports" or "del dis.exports" to force them to be pulled again.
+    @cached_property
+    def imports(self) -> Tuple[IDAImport, ...]:
+        return tuple(
+            IDAImport(self, address, thunk_address, name, namespace)
+            for address, thunk_address, name, namespace in self._ida_helpers.iter_imports()
+        )
 
     def get_import(self, name: str, default=MISSING) -> IDAImport:
         # Using ida_helpers instead of default implementation to improve performance.
@@ -414,14 +547,12 @@ class IDAFlatAPI(FlatAPI, IDADisassembler):
             return default
         return IDAImport(self, *ret)
 
-    @property
-    def exports(self) -> Iterable[IDAExport]:
-        ida_entry = self._ida_entry
-        for i in range(ida_entry.get_entry_qty()):
-            ordinal = ida_entry.get_entry_ordinal(i)
-            address = ida_entry.get_entry(ordinal)
-            name = ida_entry.get_entry_name(ordinal)
-            yield IDAExport(self, address, name)
+    @cached_property
+    def exports(self) -> Tuple[IDAExport, ...]:
+        return tuple(
+            IDAExport(self, address, name)
+            for address, name in self._ida_helpers.iter_exports()
+        )
 
     def undefine(self, start: int, end: int = None) -> bool:
         if end:
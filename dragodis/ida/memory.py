@@ -68,13 +68,16 @@ class CachedMemory:
             If set to None, a NotExistError will be thrown if data is not contiguous.
         """
         self._obtain_uncached_chunks(address, size)
-        if fill_pattern:
-            return bytes(self._memory[address:address+size:fill_pattern])
-        else:
-            try:
-                return bytes(self._memory[address:address+size])
-            except ValueError as e:
+        # If the data is contiguous, copy directly from a view of the underlying block
+        # instead of creating an intermediate sliced Memory object.
+        # (View is released immediately, since blocks can't be resized while exported.)
+        try:
+            with self._memory.view(address, address + size) as view:
+                return view.tobytes()
+        except ValueError as e:
+            if not fill_pattern:
                 raise NotExistError(f"Unable to obtain {size} bytes from 0x{address:08X}: {e}")
+        return bytes(self._memory[address:address+size:fill_pattern])
 
     def set(self, address: int, data: bytes):
         """
@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING
 from dragodis.interface import Reference, ReferenceType
 
 if TYPE_CHECKING:
-    import ida_xref
     from dragodis.ida.flat import IDAFlatAPI
 
 
@@ -21,7 +20,7 @@ class IDAReference(Reference):
         3: ReferenceType.data_read,             # ida_xref.dr_R
         4: ReferenceType.data_text,             # ida_xref.dr_T
         5: ReferenceType.data_informational,    # ida_xref.dr_I
-        # 6: ReferenceType.??  # ida_xref.dr_S  # TODO
+        # 6: ida_xref.dr_S (segment/selector reference) has no equivalent and is reported as unknown.
         16: ReferenceType.code_call,        # ida_xref.fl_CF
         17: ReferenceType.code_call,       # ida_xref.fl_CN
         18: ReferenceType.code_jump,        # ida_xref.fl_JF
@@ -30,30 +29,38 @@ class IDAReference(Reference):
         21: ReferenceType.ordinary_flow,        # ida_xref.fl_F
     }
     _type_map_inv = {value: key for key, value in _type_map.items()}
+    # Lookup table indexed directly by raw type code to avoid a dictionary lookup on the hot path.
+    # Covers all possible codes (xrefblk_t.type is a uchar) with unsupported codes set to unknown.
+    _type_table = tuple(map(_type_map.get, range(256), [ReferenceType.unknown] * 256))
 
-    def __init__(self, ida: IDAFlatAPI, xref: "ida_xref.xrefblk_t"):
-        self._ida = ida
-        self._xref = xref
-
-    @property
-    def from_address(self) -> int:
-        return self._xref.frm
+    # Fields are captured on creation and stored directly in slots, since
+    # these objects are created in large quantities during cross reference sweeps.
+    __slots__ = ("_ida", "from_address", "to_address", "is_code", "_type_code")
+    _ida: IDAFlatAPI
+    from_address: int
+    to_address: int
+    is_code: bool
+    _type_code: int
 
-    @property
-    def is_code(self) -> bool:
-        return bool(self._xref.iscode)
+    def __init__(self, ida: IDAFlatAPI, from_address: int, to_address: int, type_code: int, is_code: bool):
+        """
+        :param ida: IDA disassembler
+        :param from_address: Source address of the cross reference. (xrefblk_t.frm)
+        :param to_address: Destination address of the cross reference. (xrefblk_t.to)
+        :param type_code: Raw IDA cross reference type. (xrefblk_t.type)
+        :param is_code: Whether this is a code reference. (xrefblk_t.iscode)
+        """
+        self._ida = ida
+        self.from_address = from_address
+        self.to_address = to_address
+        self.is_code = bool(is_code)
+        self._type_code = type_code
 
     @property
     def is_data(self) -> bool:
-        return self.type.name.startswith("data")  # TODO: confirm
-
-    @property
-    def to_address(self) -> int:
-        return self._xref.to
+        # Data reference types are dr_O (1) through dr_S (6).
+        return 1 <= self._type_code <= 6
 
     @property
     def type(self) -> ReferenceType:
-        try:
-            return self._type_map[self._xref.type]
-        except KeyError:
-            raise RuntimeError(f"Unexpected reference type: {self._xref.type}")
+        return self._type_table[self._type_code]
@@ -6,7 +6,7 @@ function callback mechanics.
 """
 import logging
 import re
-from typing import Iterable, Tuple, List, Optional
+from typing import Dict, Iterable, Tuple, List, Optional
 
 import idc
 import ida_ida
@@ -16,8 +16,10 @@ import ida_funcs
 import ida_hexrays
 import ida_nalt
 import ida_name
+import ida_segment
 import ida_typeinf
 import ida_ua
+import ida_xref
 import idautils
 
 
@@ -92,6 +94,97 @@ def iter_exports() -> Iterable[Tuple[int, str]]:
         yield ea, name
 
 
+def get_function_addresses(start: int = None, end: int = None) -> Tuple[int, ...]:
+    """
+    Obtains the start addresses of all functions within the given range in a single call.
+
+    :param start: Start address (defaults to beginning of program)
+    :param end: End address (defaults to end of program)
+    :returns: Tuple of function start addresses.
+    """
+    # IDA will include the function if started in the middle of it.
+    # Ignore this function to stay consistent with Ghidra.
+    return tuple(
+        ea for ea in idautils.Functions(start=start, end=end)
+        if not (start and ea < start)
+    )
+
+
+def get_segment_bounds() -> Tuple[Tuple[int, int], ...]:
+    """
+    Obtains the start and end addresses of all segments in a single call.
+
+    :returns: Tuple of (start_address, end_address) entries.
+    """
+    # Taken from idautils.Segments()
+    entries = []
+    for n in range(ida_segment.get_segm_qty()):
+        seg = ida_segment.getnseg(n)
+        if seg:
+            entries.append((seg.start_ea, seg.end_ea))
+    return tuple(entries)
+
+
+# Reused by get_xrefs_from()/get_xrefs_to() to avoid allocating a new xrefblk_t per call.
+# (Safe since the fields are copied out before returning.)
+_xrefblk = ida_xref.xrefblk_t()
+
+
+def get_xrefs_from(address: int) -> Tuple[Tuple[int, int, int, bool], ...]:
+    """
+    Obtains all the cross references from the given address in a single call.
+    "Ordinary flow" references are ignored, since that's just a reference to the next
+    instruction, which Ghidra doesn't do.
+
+    :param address: Address to get references from.
+    :returns: Tuple of (from_address, to_address, type, is_code) entries.
+    """
+    entries = []
+    xref = _xrefblk
+    success = xref.first_from(address, ida_xref.XREF_ALL)
+    while success:
+        if xref.type != ida_xref.fl_F:
+            entries.append((xref.frm, xref.to, xref.type, bool(xref.iscode)))
+        success = xref.next_from()
+    # Returning a tuple so the results are passed by value if called through rpyc.
+    return tuple(entries)
+
+
+def get_xrefs_to(address: int) -> Tuple[Tuple[int, int, int, bool], ...]:
+    """
+    Obtains all the cross references to the given address in a single call.
+
+    :param address: Address to get references to.
+    :returns: Tuple of (from_address, to_address, type, is_code) entries.
+    """
+    entries = []
+    xref = _xrefblk
+    success = xref.first_to(address, ida_xref.XREF_ALL)
+    while success:
+        entries.append((xref.frm, xref.to, xref.type, bool(xref.iscode)))
+        success = xref.next_to()
+    # Returning a tuple so the results are passed by value if called through rpyc.
+    return tuple(entries)
+
+
+def get_variable_address(address: int) -> Optional[int]:
+    """
+    Obtains the start address of the global variable containing the given address in a single call.
+
+    :param address: An address contained in the variable.
+    :returns: Start address of the variable or None if a variable doesn't exist.
+    """
+    start_address = ida_bytes.get_item_head(address)
+    # Don't count code as "variables". Otherwise we get all the
+    # loop labels as variables.
+    if ida_bytes.is_code(ida_bytes.get_flags(address)):
+        return None
+    # Only count as variable if item has a name.
+    if not ida_name.get_name(start_address):
+        return None
+    return start_address
+
+
 def get_byte_chunks(address: int, size: int) -> Iterable[Tuple[int, int]]:
     """
     Iterates the chunks of defined bytes found within the given address range.
@@ -154,6 +247,44 @@ def get_bytes(address: int, size: int, default: int = 0) -> bytes:
     return bytes(data)
 
 
+def get_loaded_bytes(address: int, size: int) -> Optional[bytes]:
+    """
+    Obtains bytes from given address, only if all the bytes are loaded.
+    This combines is_loaded() and get_bytes() to avoid multiple calls when run remotely.
+
+    :param address: Address to pull bytes from.
+    :param size: Number of bytes to pull.
+    :returns: obtained bytes or None if address range is not fully loaded.
+    """
+    if not is_loaded(address, size):
+        return None
+    if not size:
+        return b""
+    return ida_bytes.get_bytes(address, size)
+
+
+_value_getters = {
+    1: ida_bytes.get_wide_byte,
+    2: ida_bytes.get_wide_word,
+    4: ida_bytes.get_wide_dword,
+    8: ida_bytes.get_qword,
+}
+
+
+def get_loaded_value(address: int, size: int) -> Optional[int]:
+    """
+    Obtains the byte, word, dword, or qword value at given address, only if all the bytes are loaded.
+    This combines is_loaded() and get_wide_*() to avoid multiple calls when run remotely.
+
+    :param address: Address to pull value from.
+    :param size: Size of value in bytes. (1, 2, 4, or 8)
+    :returns: obtained value or None if not fully loaded.
+    """
+    if not is_loaded(address, size):
+        return None
+    return _value_getters[size](address)
+
+
 def revert_bytes(address: int, size: int):
     """
     Reverts patched bytes back to the underlying data.
@@ -165,6 +296,41 @@ def revert_bytes(address: int, size: int):
         ida_bytes.revert_byte(offset)
 
 
+_PAGE_SHIFT = 12
+_PAGE_SIZE = 1 << _PAGE_SHIFT
+# Mapping of page number (address >> 12) to whether all bytes within the page are loaded.
+# Pages are checked lazily on first use.
+_loaded_pages: Dict[int, bool] = {}
+
+
+def reset_loaded_pages():
+    """
+    Clears the cached loaded state of memory pages used by is_loaded().
+    This must be called whenever the database or its segments change.
+    """
+    _loaded_pages.clear()
+
+
+def _is_page_loaded(page: int) -> bool:
+    """
+    Checks if all bytes within the given memory page are loaded.
+    The result is cached, so each page is only tested once.
+
+    NOTE: Bytes are assumed to never become unloaded after the fact.
+
+    :param page: Page number (address >> 12)
+    """
+    try:
+        return _loaded_pages[page]
+    except KeyError:
+        pass
+    start = page << _PAGE_SHIFT
+    # Unloaded pages usually fail on the first byte.
+    loaded = all(ida_bytes.is_loaded(offset) for offset in range(start, start + _PAGE_SIZE))
+    _loaded_pages[page] = loaded
+    return loaded
+
+
 def is_loaded(address: int, size: int) -> bool:
     """
     Checks if all bytes are loaded.
@@ -172,6 +338,12 @@ def is_loaded(address: int, size: int) -> bool:
     :param address: Address of first byte.
     :param size: Number of bytes to check.
     """
+    if size > 0:
+        first_page = address >> _PAGE_SHIFT
+        last_page = (address + size - 1) >> _PAGE_SHIFT
+        if all(_is_page_loaded(page) for page in range(first_page, last_page + 1)):
+            return True
+    # Partially loaded pages are tested byte by byte.
     return all(ida_bytes.is_loaded(offset) for offset in range(address, address + size))
 
 
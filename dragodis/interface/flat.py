@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import abc
-from typing import Iterable, Optional, Union, TYPE_CHECKING
+from typing import Iterable, List, Optional, Tuple, Union, TYPE_CHECKING
 
 import capstone
 
@@ -145,6 +145,19 @@ class FlatAPI(metaclass=abc.ABCMeta):
             entry point is before the end address.
         """
 
+    def function_addresses(self, start=None, end=None) -> List[int]:
+        """
+        Obtains the start addresses of the functions found within the range of the given
+        `start` and `end` addresses.
+        This is faster than `functions()` when only the addresses are needed, since no `Function`
+        objects are created. Use `get_function()` to obtain the `Function` object if necessary.
+
+        :param int start: Start address to start iterating functions (defaults to beginning of program)
+        :param int end: End address to end iterating functions (defaults to end of program)
+        :return: List of function start addresses.
+        """
+        return [func.start for func in self.functions(start=start, end=end)]
+
     @abc.abstractmethod
     def get_virtual_address(self, file_offset: int, default=MISSING) -> int:
         """
@@ -568,6 +581,23 @@ class FlatAPI(metaclass=abc.ABCMeta):
         Iterates (initialized) segments found in the program.
         """
 
+    def segment_bounds(self) -> List[Tuple[int, int]]:
+        """
+        Obtains the start and end addresses of the segments found in the program.
+        This is faster than `segments` when only the bounds are needed, since no `Segment`
+        objects are created.
+
+        :return: List of (start_address, end_address) tuples.
+        """
+        return [(segment.start, segment.end) for segment in self.segments]
+
+    def invalidate_segments(self):
+        """
+        Clears any cached segment information (e.g. segment lookup tables and address bounds).
+        This should be called if segments are added, removed or moved outside of Dragodis.
+        (Segments created with `create_segment()` are accounted for automatically.)
+        """
+
     @abc.abstractmethod
     def get_string_bytes(self, addr: int, length: int = None, bit_width: int = None, default=MISSING) -> bytes:
         """
@@ -729,6 +759,17 @@ class FlatAPI(metaclass=abc.ABCMeta):
         :yield: `Reference` objects.
         """
 
+    def references_from_bulk(self, addr: int) -> List[Tuple[int, int, ReferenceType]]:
+        """
+        Obtains cross references from the specified address as plain tuples.
+        This is useful when sweeping many addresses, since no `Reference` objects are created.
+        Types match those reported by `Reference.type`.
+
+        :param int addr: Address to get references from
+        :return: List of (from_address, to_address, type) tuples.
+        """
+        return [(ref.from_address, ref.to_address, ref.type) for ref in self.references_from(addr)]
+
     @abc.abstractmethod
     def references_to(self, addr: int) -> Iterable[Reference]:
         """
@@ -12,6 +12,9 @@ class Reference(metaclass=abc.ABCMeta):
     References to represent the references to or from any address or function found in a disassembler.
     """
 
+    # Allows implementations to use __slots__, since these objects are created in large quantities.
+    __slots__ = ()
+
     def __eq__(self, other):
         return isinstance(other, Reference) and (
             self.from_address == other.from_address
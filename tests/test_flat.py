@@ -130,6 +130,8 @@ def test_references(disassembler):
     assert refs[0].from_address == 0x401242
     assert refs[0].to_address == 0x40c15c
 
+    assert disassembler.references_from_bulk(0x401242) == [(0x401242, 0x40c15c, refs[0].type)]
+
 
 # # TODO: Add test for duplicate name
 # # TODO: Figure out how to manage the resetting of data addresses.
@@ -277,6 +279,7 @@ def test_functions(disassembler):
     funcs = list(disassembler.functions(start=0x4003fa, end=0x40129f))
     assert len(funcs) == 3
     assert sorted(func.start for func in funcs) == [0x401000, 0x401030, 0x401150]
+    assert disassembler.function_addresses(start=0x4003fa, end=0x40129f) == [func.start for func in funcs]
 
     # TODO: Should we be including the function where end is in the middle of the function?
     funcs = list(disassembler.functions(end=0x401049))
@@ -346,6 +349,32 @@ def test_get_byte(disassembler):
     assert disassembler.get_byte(0x40c001) == 0x64
 
 
+def test_get_byte_unloaded_ida(disassembler):
+    # Partially loaded page: .data is only initialized up to 0x40d200.
+    disassembler.get_byte(0x40d1ff)
+    disassembler.get_word(0x40d1fe)
+    assert disassembler.get_byte(0x40d200, None) is None
+    with pytest.raises(dragodis.NotExistError):
+        disassembler.get_byte(0x40d200)
+    with pytest.raises(dragodis.NotExistError):
+        disassembler.get_dword(0x40d1fe)
+    assert len(disassembler.get_bytes(0x40d1f0, 0x10)) == 0x10
+    with pytest.raises(dragodis.NotExistError):
+        disassembler.get_bytes(0x40d1f0, 0x20)
+    assert disassembler.get_bytes(0x40d1f0, 0x20, default=0)[0x10:] == b"\x00" * 0x10
+
+    # Fully loaded page shared by the .idata and .rdata segments.
+    disassembler.get_dword(0x40a10c)
+    disassembler.get_dword(0x40a10e)
+
+    # Unloaded page
+    assert disassembler.get_byte(0x117f7d8, None) is None
+    with pytest.raises(dragodis.NotExistError):
+        disassembler.get_byte(0x117f7d8)
+    with pytest.raises(dragodis.NotExistError):
+        disassembler.get_qword(0x117f7d8)
+
+
 def test_get_bytes(disassembler):
     # Code section
     assert disassembler.get_bytes(0x401035, 2) == b"\x68\x00"
@@ -12,6 +12,15 @@ def test_signature(disassembler):
     assert signature.name == func.name
 
 
+def test_signature_within_function_ida(disassembler):
+    """
+    Tests addresses within a function share the signature of the function start.
+    """
+    signature = disassembler.get_function_signature(0x401000)
+    assert disassembler.get_function_signature(0x401010) is signature
+    assert disassembler.get_function_signature(0x401010).name == "sub_401000"
+
+
 def test_signature_for_import(disassembler):
     """
     Tests getting a function signature for an external import.
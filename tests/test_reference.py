@@ -1,4 +1,3 @@
-
 import dragodis
 
 
@@ -13,3 +12,24 @@ def test_create_reference(disassembler):
     assert ref in list(insn.references_to)
     insn = disassembler.get_instruction(0x401014)
     assert ref in list(insn.references_from)
+
+
+def test_unsupported_reference_type_ida(disassembler):
+    """
+    Tests IDA reference types without an equivalent (e.g. dr_S) are reported as unknown.
+    """
+    ida_xref = disassembler._ida_xref
+    assert ida_xref.add_dref(0x401242, 0x40c000, ida_xref.dr_S)
+
+    refs = [ref for ref in disassembler.references_from(0x401242) if ref.to_address == 0x40c000]
+    assert len(refs) == 1
+    assert refs[0].is_data
+    assert not refs[0].is_code
+    assert refs[0].type == dragodis.ReferenceType.unknown
+
+    refs = list(disassembler.references_from(0x401242))
+    assert len(refs) == 2
+    assert disassembler.references_from_bulk(0x401242) == [
+        (ref.from_address, ref.to_address, ref.type) for ref in refs
+    ]
+
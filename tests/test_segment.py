@@ -1,7 +1,7 @@
 
 import pytest
 
-from dragodis import SegmentType, SegmentPermission
+from dragodis import NotExistError, SegmentType, SegmentPermission
 
 
 def test_basic(disassembler):
@@ -28,6 +28,8 @@ def test_basic(disassembler):
     actual_segments = [seg for seg in actual_segments if seg.name != "tdb"]
     print(actual_segments)
     assert len(actual_segments) == len(expected_segments)
+    segment_bounds = disassembler.segment_bounds()
+    assert all((segment.start, segment.end) in segment_bounds for segment in actual_segments)
     for segment, expected_segments in zip(actual_segments, expected_segments):
         start, end, name, initialized, permissions = expected_segments
         assert segment
@@ -49,8 +51,20 @@ def test_basic(disassembler):
         assert segment3 == segment
 
 
+def test_get_segment_missing(disassembler):
+    for address in (0x1, 0x40F000):
+        assert disassembler.get_segment(address, None) is None
+        with pytest.raises(NotExistError):
+            disassembler.get_segment(address)
+    assert disassembler.get_segment(".bogus", None) is None
+    with pytest.raises(NotExistError):
+        disassembler.get_segment(".bogus")
+
+
 def test_create_segment(disassembler):
     orig_segments = list(disassembler.segments)
+    # Look up the address first to ensure any cached segment information is refreshed on creation.
+    assert disassembler.get_segment(0x1234, None) is None
     segment = disassembler.create_segment(".test", 0x1234, 256)
     assert segment
     assert segment.name == ".test"
@@ -62,6 +76,11 @@ def test_create_segment(disassembler):
     assert len(segments) == len(orig_segments) + 1
     assert any(seg.name == ".test" for seg in segments)
 
+    # Test lookup of the new segment by address.
+    assert disassembler.get_segment(0x1234) == segment
+    assert disassembler.get_segment(0x1234 + 255) == segment
+    assert disassembler.get_segment(0x1234 + 256, None) is None
+
 
 def test_data(disassembler):
     # Test pulling from loaded memory.